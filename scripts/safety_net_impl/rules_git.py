@@ -1,6 +1,12 @@
 """Git command analysis rules for the safety net."""
 
-from .shell import _short_opts
+from collections.abc import Callable
+
+from .shell import _letter_mask, _short_opts
+
+_SHORT_F = _letter_mask("f")
+_SHORT_D = _letter_mask("d")
+_SHORT_CAP_D = _letter_mask("D")
 
 _REASON_GIT_CHECKOUT_DOUBLE_DASH = (
     "git checkout -- discards uncommitted changes permanently. Use 'git stash' first."
@@ -55,141 +61,179 @@ _REASON_GIT_COMMIT_AMEND = (
 )
 _REASON_GIT_TAG_DELETE = "git tag -d deletes a tag. Tag deletion is not allowed."
 
+# Global git options that take a separate value argument
+_GIT_OPTS_WITH_VALUE = frozenset(
+    {
+        "-c",
+        "-C",
+        "--exec-path",
+        "--git-dir",
+        "--namespace",
+        "--super-prefix",
+        "--work-tree",
+    }
+)
+
+# Global git options without a value
+_GIT_OPTS_NO_VALUE = frozenset(
+    {
+        "-p",
+        "-P",
+        "-h",
+        "--help",
+        "--no-pager",
+        "--paginate",
+        "--version",
+        "--bare",
+        "--no-replace-objects",
+        "--literal-pathspecs",
+        "--noglob-pathspecs",
+        "--icase-pathspecs",
+    }
+)
+
 
 def _analyze_git(tokens: list[str]) -> str | None:
     sub, rest = _git_subcommand_and_rest(tokens)
     if not sub:
         return None
 
-    sub = sub.lower()
-    rest_lower = [t.lower() for t in rest]
-    short = _short_opts(rest)
-
-    if sub == "checkout":
-        # Block checkout -- (discard changes)
-        if "--" in rest:
-            idx = rest.index("--")
-            return (
-                _REASON_GIT_CHECKOUT_DOUBLE_DASH
-                if idx == 0
-                else _REASON_GIT_CHECKOUT_REF_DOUBLE_DASH
-            )
-        # Block branch creation
-        if "-b" in rest_lower or "--orphan" in rest_lower:
-            return _REASON_GIT_CHECKOUT_CREATE
-        # Block branch switching (positional arg or "-" for previous branch)
-        positional = [t for t in rest if not t.startswith("-") or t == "-"]
-        if positional:
-            return _REASON_GIT_CHECKOUT_BRANCH
+    check = _GIT_SUBCOMMAND_RULES.get(sub.lower())
+    if check is None:
         return None
+    return check(rest)
 
-    if sub == "switch":
-        if "-h" in rest_lower or "--help" in rest_lower:
-            return None
-        if "-c" in rest_lower or "--create" in rest_lower:
-            return _REASON_GIT_SWITCH_CREATE
-        return _REASON_GIT_SWITCH
-
-    if sub == "restore":
-        if "-h" in rest_lower or "--help" in rest_lower or "--version" in rest_lower:
-            return None
-        if "--worktree" in rest_lower:
-            return _REASON_GIT_RESTORE_WORKTREE
-        if "--staged" in rest_lower:
-            return None
-        return _REASON_GIT_RESTORE
-
-    if sub == "reset":
-        if "--hard" in rest_lower:
-            return _REASON_GIT_RESET_HARD
-        if "--merge" in rest_lower:
-            return _REASON_GIT_RESET_MERGE
-        return None
 
-    if sub == "clean":
-        has_force = "--force" in rest_lower or "f" in short
-        if has_force:
-            return _REASON_GIT_CLEAN_FORCE
+def _check_checkout(rest: list[str]) -> str | None:
+    # Block checkout -- (discard changes)
+    if "--" in rest:
+        idx = rest.index("--")
+        return (
+            _REASON_GIT_CHECKOUT_DOUBLE_DASH
+            if idx == 0
+            else _REASON_GIT_CHECKOUT_REF_DOUBLE_DASH
+        )
+    # Block branch creation
+    rest_lower = {t.lower() for t in rest}
+    if "-b" in rest_lower or "--orphan" in rest_lower:
+        return _REASON_GIT_CHECKOUT_CREATE
+    # Block branch switching (positional arg or "-" for previous branch)
+    if any(not t.startswith("-") or t == "-" for t in rest):
+        return _REASON_GIT_CHECKOUT_BRANCH
+    return None
+
+
+def _check_switch(rest: list[str]) -> str | None:
+    rest_lower = {t.lower() for t in rest}
+    if "-h" in rest_lower or "--help" in rest_lower:
         return None
+    if "-c" in rest_lower or "--create" in rest_lower:
+        return _REASON_GIT_SWITCH_CREATE
+    return _REASON_GIT_SWITCH
 
-    if sub == "push":
-        has_force_with_lease = any(
-            t.startswith("--force-with-lease") for t in rest_lower
-        )
-        has_force = "--force" in rest_lower or "f" in short
-        if has_force and not has_force_with_lease:
-            return _REASON_GIT_PUSH_FORCE
-        if "--force" in rest_lower and has_force_with_lease:
-            return _REASON_GIT_PUSH_FORCE
-        if "f" in short and has_force_with_lease:
-            return _REASON_GIT_PUSH_FORCE
+
+def _check_restore(rest: list[str]) -> str | None:
+    rest_lower = {t.lower() for t in rest}
+    if "-h" in rest_lower or "--help" in rest_lower or "--version" in rest_lower:
         return None
+    if "--worktree" in rest_lower:
+        return _REASON_GIT_RESTORE_WORKTREE
+    if "--staged" in rest_lower:
+        return None
+    return _REASON_GIT_RESTORE
+
+
+def _check_reset(rest: list[str]) -> str | None:
+    rest_lower = {t.lower() for t in rest}
+    if "--hard" in rest_lower:
+        return _REASON_GIT_RESET_HARD
+    if "--merge" in rest_lower:
+        return _REASON_GIT_RESET_MERGE
+    return None
 
-    if sub == "branch":
-        # Block any deletion (-d or -D)
-        if "-D" in rest or "D" in short or "-d" in rest or "d" in short:
-            return _REASON_GIT_BRANCH_DELETE
-        # Allow listing: no args, or only flags
-        if not rest or all(t.startswith("-") for t in rest):
-            return None
-        # Has positional arg = creating a branch
-        return _REASON_GIT_BRANCH_CREATE
-
-    if sub == "stash":
-        if not rest_lower:
-            return None
-        if rest_lower[0] == "drop":
-            return _REASON_GIT_STASH_DROP
-        if rest_lower[0] == "clear":
-            return _REASON_GIT_STASH_CLEAR
+
+def _check_clean(rest: list[str]) -> str | None:
+    if any(t.lower() == "--force" for t in rest) or _short_opts(rest) & _SHORT_F:
+        return _REASON_GIT_CLEAN_FORCE
+    return None
+
+
+def _check_push(rest: list[str]) -> str | None:
+    rest_lower = [t.lower() for t in rest]
+    has_force_with_lease = any(t.startswith("--force-with-lease") for t in rest_lower)
+    has_long_force = "--force" in rest_lower
+    has_short_force = bool(_short_opts(rest) & _SHORT_F)
+    if (has_long_force or has_short_force) and not has_force_with_lease:
+        return _REASON_GIT_PUSH_FORCE
+    if has_long_force and has_force_with_lease:
+        return _REASON_GIT_PUSH_FORCE
+    if has_short_force and has_force_with_lease:
+        return _REASON_GIT_PUSH_FORCE
+    return None
+
+
+def _check_branch(rest: list[str]) -> str | None:
+    # Block any deletion (-d or -D)
+    if "-D" in rest or "-d" in rest or _short_opts(rest) & (_SHORT_D | _SHORT_CAP_D):
+        return _REASON_GIT_BRANCH_DELETE
+    # Allow listing: no args, or only flags
+    if all(t.startswith("-") for t in rest):
         return None
+    # Has positional arg = creating a branch
+    return _REASON_GIT_BRANCH_CREATE
 
-    if sub == "rebase":
-        if "-h" in rest_lower or "--help" in rest_lower:
-            return None
-        return _REASON_GIT_REBASE
 
-    if sub == "commit":
-        if "--amend" in rest_lower:
-            return _REASON_GIT_COMMIT_AMEND
+def _check_stash(rest: list[str]) -> str | None:
+    if not rest:
         return None
+    action = rest[0].lower()
+    if action == "drop":
+        return _REASON_GIT_STASH_DROP
+    if action == "clear":
+        return _REASON_GIT_STASH_CLEAR
+    return None
+
 
-    if sub == "tag":
-        if "-d" in rest_lower or "--delete" in rest_lower or "d" in short:
-            return _REASON_GIT_TAG_DELETE
+def _check_rebase(rest: list[str]) -> str | None:
+    rest_lower = {t.lower() for t in rest}
+    if "-h" in rest_lower or "--help" in rest_lower:
         return None
+    return _REASON_GIT_REBASE
 
+
+def _check_commit(rest: list[str]) -> str | None:
+    if any(t.lower() == "--amend" for t in rest):
+        return _REASON_GIT_COMMIT_AMEND
     return None
 
 
+def _check_tag(rest: list[str]) -> str | None:
+    rest_lower = {t.lower() for t in rest}
+    if "-d" in rest_lower or "--delete" in rest_lower or _short_opts(rest) & _SHORT_D:
+        return _REASON_GIT_TAG_DELETE
+    return None
+
+
+# Destructive-operation checks keyed by (lowercased) git subcommand
+_GIT_SUBCOMMAND_RULES: dict[str, Callable[[list[str]], str | None]] = {
+    "checkout": _check_checkout,
+    "switch": _check_switch,
+    "restore": _check_restore,
+    "reset": _check_reset,
+    "clean": _check_clean,
+    "push": _check_push,
+    "branch": _check_branch,
+    "stash": _check_stash,
+    "rebase": _check_rebase,
+    "commit": _check_commit,
+    "tag": _check_tag,
+}
+
+
 def _git_subcommand_and_rest(tokens: list[str]) -> tuple[str | None, list[str]]:
     if not tokens or tokens[0].lower() != "git":
         return None, []
 
-    opts_with_value = {
-        "-c",
-        "-C",
-        "--exec-path",
-        "--git-dir",
-        "--namespace",
-        "--super-prefix",
-        "--work-tree",
-    }
-    opts_no_value = {
-        "-p",
-        "-P",
-        "-h",
-        "--help",
-        "--no-pager",
-        "--paginate",
-        "--version",
-        "--bare",
-        "--no-replace-objects",
-        "--literal-pathspecs",
-        "--noglob-pathspecs",
-        "--icase-pathspecs",
-    }
-
     i = 1
     while i < len(tokens):
         tok = tokens[i]
@@ -200,18 +244,18 @@ def _git_subcommand_and_rest(tokens: list[str]) -> tuple[str | None, list[str]]:
         if not tok.startswith("-") or tok == "-":
             break
 
-        if tok in opts_no_value:
+        if tok in _GIT_OPTS_NO_VALUE:
             i += 1
             continue
 
-        if tok in opts_with_value:
+        if tok in _GIT_OPTS_WITH_VALUE:
             i += 2
             continue
 
         if tok.startswith("--"):
             if "=" in tok:
                 opt, _value = tok.split("=", 1)
-                if opt in opts_with_value:
+                if opt in _GIT_OPTS_WITH_VALUE:
                     i += 1
                     continue
             i += 1
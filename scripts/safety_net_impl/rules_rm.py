@@ -3,12 +3,15 @@
 import os
 import posixpath
 
-from .shell import _short_opts
+from .shell import _letter_mask, _short_opts
 
 _REASON_RM_RF = "rm -rf is destructive. List files first, then delete individually."
 _REASON_RM_RF_ROOT_HOME = "rm -rf on root or home paths is extremely dangerous."
 _STRICT_SUFFIX = " [strict mode - disable with: unset SAFETY_NET_STRICT]"
 
+_SHORT_R = _letter_mask("r")
+_SHORT_F = _letter_mask("f")
+
 
 def _analyze_rm(
     tokens: list[str],
@@ -20,8 +23,8 @@ def _analyze_rm(
     rest = tokens[1:]
     rest_lower = [t.lower() for t in rest]
     short = _short_opts(rest)
-    recursive = "--recursive" in rest_lower or "r" in short
-    force = "--force" in rest_lower or "f" in short
+    recursive = "--recursive" in rest_lower or bool(short & _SHORT_R)
+    force = "--force" in rest_lower or bool(short & _SHORT_F)
 
     if not (recursive and force):
         return None
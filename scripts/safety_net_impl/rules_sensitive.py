@@ -1,6 +1,7 @@
 """Sensitive file read blocking rules for the safety net."""
 
 import posixpath
+from collections.abc import Iterator
 
 _REASON_SENSITIVE_READ = (
     "Reading sensitive files is not allowed. "
@@ -17,6 +18,9 @@ _SENSITIVE_DIRS = {
     ".codex",
 }
 
+# Precomputed "<dir>/" prefixes for a single str.startswith() check
+_SENSITIVE_DIR_PREFIXES = tuple(d + "/" for d in _SENSITIVE_DIRS)
+
 # Sensitive files (exact match after home prefix)
 _SENSITIVE_FILES = {
     ".api_keys",
@@ -25,6 +29,13 @@ _SENSITIVE_FILES = {
     ".claude/.claude.json",
 }
 
+# Spellings of the home directory, bare and as a path prefix (with its length)
+_HOME_EXACT = frozenset({"~", "$HOME", "${HOME}"})
+_HOME_PREFIXES = (("~/", 2), ("$HOME/", 6), ("${HOME}/", 8))
+
+# Inputs that _normpath always hands to posixpath.normpath
+_NORMPATH_SPECIAL = frozenset({"", ".", "..", "/"})
+
 # Commands that read file contents
 _READ_COMMANDS = {
     "cat",
@@ -60,32 +71,46 @@ def _analyze_sensitive_read(tokens: list[str]) -> str | None:
     if cmd not in _READ_COMMANDS:
         return None
 
-    targets = _extract_file_targets(tokens)
-    for target in targets:
-        if _is_sensitive_path(target):
-            return _REASON_SENSITIVE_READ
+    return _analyze_sensitive_read_args(tokens, 1)
+
+
+def _analyze_sensitive_read_args(tokens: list[str], start: int) -> str | None:
+    """Analyze the arguments of a file-reading command for sensitive paths.
+
+    Args:
+        tokens: Token list containing the command's arguments.
+        start: Index of the first argument; the caller has already checked
+            that the command name is in _READ_COMMANDS.
+
+    Returns:
+        Reason string if blocked, None if allowed.
+    """
+    if any(_is_sensitive_path(t) for t in _extract_file_targets(tokens, start)):
+        return _REASON_SENSITIVE_READ
 
     return None
 
 
-def _extract_file_targets(tokens: list[str]) -> list[str]:
-    """Extract file path arguments from command tokens.
+def _extract_file_targets(tokens: list[str], start: int = 1) -> Iterator[str]:
+    """Yield file path arguments from command tokens.
 
-    Skips flags (tokens starting with -) unless after --.
+    Arguments are read from tokens[start:]. Skips flags (tokens starting
+    with -) unless after --. Targets are produced lazily so callers can stop
+    at the first match.
     """
-    targets: list[str] = []
     after_double_dash = False
     skip_next = False
 
     # Flags that take a value argument (command-specific)
     flags_with_value = {"-n", "-c", "-q", "--bytes", "--lines"}
 
-    for tok in tokens[1:]:
+    for k in range(start, len(tokens)):
+        tok = tokens[k]
         if skip_next:
             skip_next = False
             continue
         if after_double_dash:
-            targets.append(tok)
+            yield tok
             continue
         if tok == "--":
             after_double_dash = True
@@ -95,9 +120,7 @@ def _extract_file_targets(tokens: list[str]) -> list[str]:
             if tok in flags_with_value:
                 skip_next = True
             continue
-        targets.append(tok)
-
-    return targets
+        yield tok
 
 
 def _is_sensitive_path(path: str) -> bool:
@@ -107,16 +130,13 @@ def _is_sensitive_path(path: str) -> bool:
     if normalized is None:
         return False
 
-    # Check exact file matches
-    if normalized in _SENSITIVE_FILES:
-        return True
-
-    # Check directory matches (path is inside sensitive dir)
-    for sensitive_dir in _SENSITIVE_DIRS:
-        if normalized == sensitive_dir or normalized.startswith(sensitive_dir + "/"):
-            return True
-
-    return False
+    return (
+        # Exact file or directory matches
+        normalized in _SENSITIVE_FILES
+        or normalized in _SENSITIVE_DIRS
+        # Path is inside a sensitive dir
+        or normalized.startswith(_SENSITIVE_DIR_PREFIXES)
+    )
 
 
 def _normalize_home_path(path: str) -> str | None:
@@ -125,19 +145,12 @@ def _normalize_home_path(path: str) -> str | None:
     Returns the path relative to home (without leading ~/ or $HOME/),
     or None if the path is not under the home directory.
     """
-    # Handle ~ prefix
-    if path == "~":
-        return ""
-    if path.startswith("~/"):
-        return posixpath.normpath(path[2:])
-
-    # Handle $HOME prefix
-    if path == "$HOME" or path == "${HOME}":
+    # Handle ~, $HOME and ${HOME} prefixes
+    if path in _HOME_EXACT:
         return ""
-    if path.startswith("$HOME/"):
-        return posixpath.normpath(path[6:])
-    if path.startswith("${HOME}/"):
-        return posixpath.normpath(path[8:])
+    for prefix, strip_len in _HOME_PREFIXES:
+        if path.startswith(prefix):
+            return _normpath(path[strip_len:])
 
     # Handle /home/username paths
     if path.startswith("/home/"):
@@ -145,6 +158,24 @@ def _normalize_home_path(path: str) -> str | None:
         if len(parts) >= 3:
             # /home/username/... -> ...
             rest = "/".join(parts[3:])
-            return posixpath.normpath(rest) if rest else ""
+            return _normpath(rest) if rest else ""
 
     return None
+
+
+def _normpath(path: str) -> str:
+    """posixpath.normpath() with a fast path for already-normal paths.
+
+    Only "." / ".." components and repeated slashes need real normalization;
+    otherwise dropping a single trailing slash gives the same result.
+    """
+    if (
+        path in _NORMPATH_SPECIAL
+        or "//" in path
+        or "/./" in path
+        or "/../" in path
+        or path.startswith(("./", "../"))
+        or path.endswith(("/.", "/.."))
+    ):
+        return posixpath.normpath(path)
+    return path[:-1] if path.endswith("/") else path
@@ -1,9 +1,32 @@
 """Shell parsing helpers for the safety net."""
 
-import shlex
+import string
+from functools import lru_cache
 
+# Bit per ASCII letter for packing short-option clusters into an int; any other
+# character maps to _NON_LETTER_BIT.
+_LETTER_BITS = {ch: 1 << i for i, ch in enumerate(string.ascii_letters)}
+_NON_LETTER_BIT = 1 << len(string.ascii_letters)
 
+# Quote and escape characters, plus ASCII whitespace that str.split() breaks
+# on but shlex does not
+_SHLEX_SPECIAL = "'\"\\\x0b\x0c\x1c\x1d\x1e\x1f"
+
+
+def _letter_mask(letters: str) -> int:
+    mask = 0
+    for ch in letters:
+        mask |= _LETTER_BITS.get(ch, _NON_LETTER_BIT)
+    return mask
+
+
+# Parse results are memoized as tuples so callers always get a fresh list.
 def _split_shell_commands(command: str) -> list[str]:
+    return list(_split_shell_commands_cached(command))
+
+
+@lru_cache(maxsize=256)
+def _split_shell_commands_cached(command: str) -> tuple[str, ...]:
     parts: list[str] = []
     buf: list[str] = []
     in_single = False
@@ -88,12 +111,24 @@ def _split_shell_commands(command: str) -> list[str]:
     part = "".join(buf).strip()
     if part:
         parts.append(part)
-    return parts
+    return tuple(parts)
 
 
 def _shlex_split(segment: str) -> list[str] | None:
+    tokens = _shlex_split_cached(segment)
+    return list(tokens) if tokens is not None else None
+
+
+@lru_cache(maxsize=256)
+def _shlex_split_cached(segment: str) -> tuple[str, ...] | None:
+    # Without quotes or escapes shlex only splits on whitespace.
+    if segment.isascii() and not any(ch in segment for ch in _SHLEX_SPECIAL):
+        return tuple(segment.split())
+    # Imported here so hooks that never see a quoted segment skip loading it.
+    import shlex
+
     try:
-        return shlex.split(segment, posix=True)
+        return tuple(shlex.split(segment, posix=True))
     except ValueError:
         return None
 
@@ -192,10 +227,11 @@ def _strip_wrappers(tokens: list[str]) -> list[str]:
     return _strip_env_assignments(tokens)
 
 
-def _short_opts(tokens: list[str]) -> set[str]:
-    opts: set[str] = set()
+def _short_opts(tokens: list[str]) -> int:
+    """Return the short option letters in `tokens` as a `_letter_mask` bitmask."""
+    opts = 0
     for tok in tokens:
         if tok.startswith("--") or not tok.startswith("-") or tok == "-":
             continue
-        opts.update(tok[1:])
+        opts |= _letter_mask(tok[1:])
     return opts
@@ -8,16 +8,18 @@ from pathlib import Path
 
 
 class TempDirTestCase(unittest.TestCase):
-    """Base test class that provides a temporary directory for each test."""
+    """Base test class that provides a temporary directory for each test.
 
-    tmpdir: Path
-    _tmpdir_obj: tempfile.TemporaryDirectory
+    The directory is created on first access to ``tmpdir``, so tests that never
+    use it do not pay for creating and removing it.
+    """
 
-    def setUp(self) -> None:
-        super().setUp()
-        self._tmpdir_obj = tempfile.TemporaryDirectory()
-        self.tmpdir = Path(self._tmpdir_obj.name)
+    _tmpdir_path: Path | None = None
 
-    def tearDown(self) -> None:
-        self._tmpdir_obj.cleanup()
-        super().tearDown()
+    @property
+    def tmpdir(self) -> Path:
+        if self._tmpdir_path is None:
+            tmpdir_obj = tempfile.TemporaryDirectory()
+            self.addCleanup(tmpdir_obj.cleanup)
+            self._tmpdir_path = Path(tmpdir_obj.name)
+        return self._tmpdir_path
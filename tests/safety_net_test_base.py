@@ -33,8 +33,8 @@ class SafetyNetTestCase(TempDirTestCase):
     ) -> None:
         """Assert that a command is blocked with a reason containing the given text."""
         output = self._run_guard(command, cwd=cwd)
-        self.assertIsNotNone(output, f"Expected {command!r} to be blocked")
-        assert output is not None
+        if output is None:
+            self.fail(f"Expected {command!r} to be blocked")
         hook_output = output.get("hookSpecificOutput", {})
         self.assertEqual(hook_output.get("permissionDecision"), "deny")
         reason = hook_output.get("permissionDecisionReason", "")
@@ -43,4 +43,5 @@ class SafetyNetTestCase(TempDirTestCase):
     def _assert_allowed(self, command: str, *, cwd: str | None = None) -> None:
         """Assert that a command is allowed (no output)."""
         output = self._run_guard(command, cwd=cwd)
-        self.assertIsNone(output, f"Expected {command!r} to be allowed, got {output}")
+        if output is not None:
+            self.fail(f"Expected {command!r} to be allowed, got {output}")
@@ -23,6 +23,31 @@ class EdgeCasesTests(SafetyNetTestCase):
         self.assertEqual(result, 0)
         self.assertEqual(output, "")
 
+    def test_binary_stdin_is_decoded(self) -> None:
+        """Hook input read from a byte stream should be parsed as UTF-8 JSON."""
+        input_data = {
+            "tool_name": "Bash",
+            "tool_input": {"command": "git reset --hard"},
+        }
+        stdin = io.TextIOWrapper(io.BytesIO(json.dumps(input_data).encode()))
+        with mock.patch("sys.stdin", stdin):
+            with mock.patch("sys.stdout", new_callable=io.StringIO) as mock_stdout:
+                result = safety_net.main()
+                output = mock_stdout.getvalue()
+
+        self.assertEqual(result, 0)
+        self.assertIn("deny", output)
+
+    def test_invalid_utf8_input_allows(self) -> None:
+        """Undecodable input bytes should allow the command (fail open)."""
+        with mock.patch("sys.stdin", io.TextIOWrapper(io.BytesIO(b"\xff\xfe"))):
+            with mock.patch("sys.stdout", new_callable=io.StringIO) as mock_stdout:
+                result = safety_net.main()
+                output = mock_stdout.getvalue()
+
+        self.assertEqual(result, 0)
+        self.assertEqual(output, "")
+
     def test_non_dict_input_allows(self) -> None:
         """Non-dict JSON input should allow the command (fail open)."""
         with mock.patch("sys.stdin", io.StringIO(json.dumps([1, 2, 3]))):
@@ -160,3 +185,18 @@ class EdgeCasesTests(SafetyNetTestCase):
         parsed: dict = json.loads(output)
         reason = parsed["hookSpecificOutput"]["permissionDecisionReason"]
         self.assertNotIn("abc123", reason)
+
+    def test_deny_output_redacts_authorization_header(self) -> None:
+        for header in ("Authorization", "Authorızation"):
+            command = f'curl -H "{header}: supersecret" x; git reset --hard'
+            input_data = {"tool_name": "Bash", "tool_input": {"command": command}}
+            with mock.patch("sys.stdin", io.StringIO(json.dumps(input_data))):
+                with mock.patch("sys.stdout", new_callable=io.StringIO) as mock_stdout:
+                    result = safety_net.main()
+                    output = mock_stdout.getvalue()
+
+            self.assertEqual(result, 0)
+            parsed: dict = json.loads(output)
+            reason = parsed["hookSpecificOutput"]["permissionDecisionReason"]
+            self.assertIn("<redacted>", reason)
+            self.assertNotIn("supersecret", reason)
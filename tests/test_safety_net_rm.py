@@ -38,9 +38,21 @@ class RmRfBlockedTests(SafetyNetTestCase):
             "rm -rf",
         )
 
+    def test_python_c_rm_rf_line_continuation_blocked(self) -> None:
+        self._assert_blocked(
+            "python -c 'import os; os.system(\"rm -r /some/path \\\n-f\")'",
+            "rm -rf",
+        )
+
     def test_command_substitution_rm_rf_blocked(self) -> None:
         self._assert_blocked("echo $(rm -rf /some/path)", "rm -rf")
 
+    def test_xargs_rm_rf_blocked(self) -> None:
+        self._assert_blocked("xargs rm -rf /some/path", "rm -rf")
+
+    def test_quoted_rm_name_blocked(self) -> None:
+        self._assert_blocked('r"m" -rf /some/path', "rm -rf")
+
     def test_tmpdir_assignment_not_trusted_blocked(self) -> None:
         self._assert_blocked(
             "TMPDIR=/Users rm -rf $TMPDIR/test-dir",
@@ -49,6 +61,14 @@ class RmRfBlockedTests(SafetyNetTestCase):
 
 
 class RmRfAllowedTests(SafetyNetTestCase):
+    def test_long_repeated_rm_without_force_allowed(self) -> None:
+        # Used to backtrack catastrophically in the text heuristic.
+        self._assert_allowed('python -c "' + "rm -r " * 2000 + '"')
+
+    def test_long_dotted_path_allowed(self) -> None:
+        # Used to rescan the path for an rm prefix at every "/".
+        self._assert_allowed("ls " + "/." * 12000 + " git")
+
     # rm -rf on temp directories
     def test_rm_rf_tmp_allowed(self) -> None:
         self._assert_allowed("rm -rf /tmp/test-dir")
@@ -83,6 +103,12 @@ class RmRfCwdAwareTests(SafetyNetTestCase):
         with mock.patch.dict(os.environ, {"HOME": str(self.tmpdir)}):
             self._assert_allowed("rm -rf build", cwd=str(repo))
 
+    def test_rm_rf_relative_path_rechecked_when_home_changes(self) -> None:
+        with mock.patch.dict(os.environ, {"HOME": str(self.tmpdir)}):
+            self._assert_blocked("rm -rf build", "rm -rf", cwd=str(self.tmpdir))
+        with mock.patch.dict(os.environ, {"HOME": str(self.tmpdir / "other")}):
+            self._assert_allowed("rm -rf build", cwd=str(self.tmpdir))
+
     def test_rm_rf_relative_path_allowed(self) -> None:
         self._assert_allowed("rm -rf build", cwd=str(self.tmpdir))
 
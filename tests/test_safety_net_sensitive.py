@@ -108,6 +108,12 @@ class SensitiveEmbeddedTests(SafetyNetTestCase):
     def test_sh_c_cat_ssh_blocked(self) -> None:
         self._assert_blocked("sh -c 'cat ~/.ssh/id_rsa'", "sensitive files")
 
+    def test_nice_cat_ssh_blocked(self) -> None:
+        self._assert_blocked("nice -n 5 cat ~/.ssh/id_rsa", "sensitive files")
+
+    def test_quoted_path_ssh_blocked(self) -> None:
+        self._assert_blocked('cat ~/.s"s"h/id_rsa', "sensitive files")
+
 
 class NonSensitiveAllowedTests(SafetyNetTestCase):
     """Tests for allowed non-sensitive file reads."""